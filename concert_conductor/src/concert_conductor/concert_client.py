@@ -43,6 +43,7 @@ class ConcertClient(object):
         'msg',                 # concert_msgs.ConcertClient
         '_cached_status_msg',  # rocon_app_manager_msgs.Status, details of the last status update from the client
         'gateway_info',        # gateway_msgs.RemoteGateway
+        '_gateway_namespace',  # ros friendly root namespace of the client's pulled handles, e.g. '/turtlebot_1234'
         '_timestamps',         # last observed and last state change timestamps
         '_transition_handlers',
         '_lock',               # for protecting access to the msg variable
@@ -67,6 +68,7 @@ class ConcertClient(object):
         """The publishable data structure describing a concert client."""
         self.msg.name = concert_alias
         self.msg.gateway_name = gateway_info.name
+        self._gateway_namespace = '/' + gateway_info.name.lower().replace(' ', '_')
         self.msg.state = ConcertClient.State.PENDING
         self.msg.ip = gateway_info.ip
         self.msg.is_local_client = is_local_client
@@ -84,7 +86,7 @@ class ConcertClient(object):
         self._timestamps['last_state_change'] = rospy.get_rostime()
 
         # status
-        rospy.Subscriber('/' + self.gateway_name.lower().replace(' ', '_') + '/' + 'status', rapp_manager_msgs.Status, self._ros_status_cb)
+        rospy.Subscriber(self._gateway_namespace + '/status', rapp_manager_msgs.Status, self._ros_status_cb)
 
     ##############################################################################
     # Conveniences
@@ -107,6 +109,12 @@ class ConcertClient(object):
     @gateway_name.setter
     def gateway_name(self, value):
         self.msg.gateway_name = value
+        self._gateway_namespace = '/' + value.lower().replace(' ', '_')
+
+    @property
+    def gateway_namespace(self):
+        """The ros friendly namespace the client's handles are pulled into (e.g. '/turtlebot_1234')"""
+        return self._gateway_namespace
 
     @property
     def is_local_client(self):
@@ -180,7 +188,7 @@ class ConcertClient(object):
         :raises: :exc:`.InvalidTransitionException` if the transition is not permitted
         '''
         old_state = self.state
-        if (old_state, new_state) in transitions.StateTransitionTable.keys():
+        if (old_state, new_state) in transitions.StateTransitionTable:
             rospy.loginfo("Conductor : concert client transition [%s->%s][%s]" % (old_state, new_state, self.concert_alias))
             self._timestamps['last_state_change'] = rospy.get_rostime()
             self.state = new_state
@@ -159,14 +159,13 @@ class ConcertClients(object):
 
         # existing client updates
         for (gateway_name, concert_client) in self._flat_client_dict.items():
-            if gateway_name in remote_gateway_index.keys():
-                gateway_info = remote_gateway_index[gateway_name]  # gateway_msgs.RemoteGateway
+            gateway_info = remote_gateway_index.pop(gateway_name, None)  # gateway_msgs.RemoteGateway, also removes it from the index
+            if gateway_info is not None:
                 # common client update tasks - update the timestamp and check if it got a status update
                 common_update_result = concert_client.update(gateway_info)  # this 'touches' the object and also checks if a rapp manager status message came in
                 # now relay to one of the update_STATE_client handlers
                 state_dependant_result = self._state_handlers[concert_client.state](gateway_info, concert_client)
                 result = common_update_result or state_dependant_result
-                del remote_gateway_index[gateway_name]  # remove it from the index.
             else:
                 result = self._state_handlers[concert_client.state](None, concert_client)
             if result:
@@ -234,8 +233,8 @@ class ConcertClients(object):
             self._transition(concert_client, State.GONE)()
 
         # Check for handles
-        platform_info_service_name = '/' + concert_client.gateway_name.lower().replace(' ', '_') + '/' + 'platform_info'
-        list_rapps_service_name = '/' + concert_client.gateway_name.lower().replace(' ', '_') + '/' + 'list_rapps'
+        platform_info_service_name = concert_client.gateway_namespace + '/platform_info'
+        list_rapps_service_name = concert_client.gateway_namespace + '/list_rapps'
         try:
             rospy.wait_for_service(platform_info_service_name, 0.1)
             rospy.wait_for_service(list_rapps_service_name, 0.1)
@@ -329,7 +328,7 @@ class ConcertClients(object):
             return True
         elif self._param['auto_invite']:
             # try an invite
-            invite = rospy.ServiceProxy('/' + concert_client.gateway_name.lower().replace(' ', '_') + '/invite', rocon_app_manager_srvs.Invite)
+            invite = rospy.ServiceProxy(concert_client.gateway_namespace + '/invite', rocon_app_manager_srvs.Invite)
             try:
                 response = invite(remote_target_name=self._concert_name,
                                   application_namespace=concert_client.concert_alias.lower().replace(' ', '_'),
@@ -382,8 +381,8 @@ class ConcertClients(object):
             return True
 
         # Check for handles
-        start_app_service_name = '/' + concert_client.gateway_name.lower().replace(' ', '_') + '/start_rapp'
-        stop_app_service_name = '/' + concert_client.gateway_name.lower().replace(' ', '_') + '/stop_rapp'
+        start_app_service_name = concert_client.gateway_namespace + '/start_rapp'
+        stop_app_service_name = concert_client.gateway_namespace + '/stop_rapp'
         try:
             rospy.wait_for_service(start_app_service_name, 0.1)
             rospy.wait_for_service(stop_app_service_name, 0.1)
@@ -469,7 +468,7 @@ class ConcertClients(object):
         if concert_client.state != State.AVAILABLE:
             rospy.logwarn("Conductor : stubbornly refusing to uninvite an uninvited client [%s][%s]" % (concert_client.concert_alias, concert_client.gateway_name))
             return
-        invite = rospy.ServiceProxy('/' + concert_client.gateway_name.lower().replace(' ', '_') + '/invite', rocon_app_manager_srvs.Invite)
+        invite = rospy.ServiceProxy(concert_client.gateway_namespace + '/invite', rocon_app_manager_srvs.Invite)
         try:
             response = invite(remote_target_name=self._concert_name,
                               application_namespace=concert_client.concert_alias,
@@ -145,12 +145,9 @@ class Conductor(object):
         '''
         msg = concert_msgs.ConcertClients()
         if clients:  # don't add anything if it's empty (just initiating the latched publisher
-            for concert_client in clients[ConcertClient.State.UNINVITED].values():
-                msg.uninvited_clients.append(concert_client.msg)
-            for concert_client in clients[ConcertClient.State.MISSING].values():
-                msg.missing_clients.append(concert_client.msg)
-            for concert_client in clients[ConcertClient.State.AVAILABLE].values():
-                msg.clients.append(concert_client.msg)
+            msg.uninvited_clients = [concert_client.msg for concert_client in clients[ConcertClient.State.UNINVITED].values()]
+            msg.missing_clients = [concert_client.msg for concert_client in clients[ConcertClient.State.MISSING].values()]
+            msg.clients = [concert_client.msg for concert_client in clients[ConcertClient.State.AVAILABLE].values()]
         if changes_only:
             publisher = self.publishers["concert_client_changes"]  # default
         else:
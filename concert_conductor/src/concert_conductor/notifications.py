@@ -50,12 +50,12 @@ class Notifications(object):
         :raises: :exc:`KeyError` if no such request
         :raises: :exc:`TypeError` if input state string is not valid
         """
-        if state not in self.flags.keys():
+        if state not in self.flags:
             raise TypeError("invalid state %s" % state)
         return self.flags[state]
 
     def __setitem__(self, state, value):
-        if state not in self.flags.keys():
+        if state not in self.flags:
             raise TypeError("invalid state %s" % state)
         self.flags[state] = value
 
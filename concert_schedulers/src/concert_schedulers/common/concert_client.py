@@ -40,6 +40,8 @@ class ConcertClient(object):
             'gateway_name',  # alias to msg.gateway_name
             'allocated',     # boolean value representing whether it has been allocated or not.
             '_request_id',   # id (uuid hex string) of the request it is allocated to
+            '_owner',        # uuid_msgs.UniqueID of the request it is allocated to (converted once from _request_id)
+            '_rapp_names',   # names of the rapps this client can run
             'allocated_priority',  # priority (int) of the request it is allocated to
             '_resource',     # scheduler_msgs.Resource it fulfills
         ]
@@ -60,6 +62,7 @@ class ConcertClient(object):
         self.allocated = False
         """Whether or not it is currently allocated."""
         self._request_id = None
+        self._owner = uuid_msgs.UniqueID()
         self._resource = None
         self.allocated_priority = 0  # irrelevant while self.allocated is false
         """If allocated, this indicates its priority."""
@@ -69,6 +72,7 @@ class ConcertClient(object):
         """The human readable concert alias for this client."""
         self.gateway_name = self.msg.gateway_name
         """The concert client's name on the gateway network (typically has postfixed uuid)"""
+        self._rapp_names = [rapp.name for rapp in self.msg.rapps]
 
     ##########################################################################
     # Convert
@@ -102,8 +106,8 @@ class ConcertClient(object):
             msg.status = scheduler_msgs.CurrentStatus.ALLOCATED
         else:
             msg.status = scheduler_msgs.CurrentStatus.AVAILABLE
-        msg.owner = unique_id.toMsg(uuid.UUID(self._request_id)) if self._request_id else uuid_msgs.UniqueID()  # self._request_id is a hex string
-        msg.rapps = [rapp.name for rapp in self.msg.rapps]
+        msg.owner = self._owner
+        msg.rapps = self._rapp_names
         return msg
 
     ##########################################################################
@@ -142,12 +146,14 @@ class ConcertClient(object):
         self.allocated_priority = request_priority
         self.allocated = True
         self._request_id = request_id
+        self._owner = unique_id.toMsg(uuid.UUID(request_id))  # request_id is a hex string
         self._resource = resource
         try:
             self._start(self.msg.gateway_name, resource)
         except FailedToStartRappsException as e:
             self.allocated = False
             self._request_id = None
+            self._owner = uuid_msgs.UniqueID()
             self._resource = None
             raise FailedToAllocateException(str(e))
 
@@ -160,6 +166,7 @@ class ConcertClient(object):
         self.allocated = False
         self.allocated_priority = 0  # must set this after we set allocated to false
         self._request_id = None
+        self._owner = uuid_msgs.UniqueID()
         self._resource = None
 
     def is_compatible(self, resource):
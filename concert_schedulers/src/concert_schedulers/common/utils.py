@@ -20,6 +20,32 @@ import rocon_uri
 # Methods
 ##############################################################################
 
+_compatible_uris = {}  # { (resource uri, platform uri) : bool }, memoised rocon_uri.is_compatible results
+_compatible_uris_max_size = 1024  # the cache is flushed when it grows past this
+
+
+def is_compatible_uri(resource_uri, platform_uri):
+    '''
+      Memoised wrapper around rocon_uri.is_compatible. The scheduler repeatedly
+      checks the same few resource and client uri pairs every time it updates, so
+      parsing and matching them again each time is wasted effort.
+
+      :param str resource_uri: rocon uri of the requested resource
+      :param str platform_uri: rocon uri of the concert client's platform
+      :returns: true if compatible, false otherwise
+      :rtype: bool
+    '''
+    key = (resource_uri, platform_uri)
+    try:
+        return _compatible_uris[key]
+    except KeyError:
+        pass
+    result = rocon_uri.is_compatible(resource_uri, platform_uri)
+    if len(_compatible_uris) >= _compatible_uris_max_size:
+        _compatible_uris.clear()
+    _compatible_uris[key] = result
+    return result
+
 
 def is_compatible(concert_client, resource):
     '''
@@ -30,9 +56,8 @@ def is_compatible(concert_client, resource):
       :returns: true if compatible, false otherwise
       :rtype: bool
     '''
-    if not rocon_uri.is_compatible(resource.uri, concert_client.platform_info.uri):
-        return False
+    # cheap rapp name check first, it rules out most clients without touching the uris
     for client_rapp in concert_client.rapps:
         if resource.rapp == client_rapp.name:
-            return True
+            return is_compatible_uri(resource.uri, concert_client.platform_info.uri)
     return False
@@ -109,10 +109,11 @@ class CompatibilityTreeScheduler(object):
         pending_notifications = []
         self._lock.acquire()
         invited_clients = msg.clients + msg.missing_clients  # both connected and missing (lost wireless connection)
+        invited_gateway_names = set(client.gateway_name for client in invited_clients)
         # new_clients: concert_msgs.ConcertClient[]
-        new_clients = [client for client in invited_clients if client.gateway_name not in self._clients.keys()]
+        new_clients = [client for client in invited_clients if client.gateway_name not in self._clients]
         # lost_clients: common.ConcertClient[]
-        lost_clients = [client for client in self._clients.values() if client.gateway_name not in [c.gateway_name for c in invited_clients]]
+        lost_clients = [client for client in self._clients.values() if client.gateway_name not in invited_gateway_names]
         # work over the client list
         for client in new_clients:
             rospy.loginfo("Scheduler : new concert client [%s]" % client.name)
@@ -214,14 +215,21 @@ class CompatibilityTreeScheduler(object):
         # Sort the request sets
         ########################################
         unallocated_clients = [client for client in self._clients.values() if not client.allocated]
-        new_replies = []
-        pending_replies = []
-        releasing_replies = []
+        # bucket the replies by status and index them by request id in a single pass
+        replies_by_status = {
+            scheduler_msgs.Request.NEW: [],
+            scheduler_msgs.Request.WAITING: [],
+            scheduler_msgs.Request.CANCELING: []
+        }
+        replies_by_request_id = {}  # { uuid.UUID : (request_set, reply) }
         for request_set in self._request_sets.values():
-            new_replies.extend([r for r in request_set.values() if r.msg.status == scheduler_msgs.Request.NEW])
-            pending_replies.extend([r for r in request_set.values() if r.msg.status == scheduler_msgs.Request.WAITING])
-            #pending_replies.extend([r for r in request_set.values() if r.msg.status == scheduler_msgs.Request.NEW or r.msg.status == scheduler_msgs.Request.WAITING])
-            releasing_replies.extend([r for r in request_set.values() if r.msg.status == scheduler_msgs.Request.CANCELING])
+            for reply in request_set.values():
+                replies_by_request_id[reply.uuid] = (request_set, reply)
+                if reply.msg.status in replies_by_status:
+                    replies_by_status[reply.msg.status].append(reply)
+        new_replies = replies_by_status[scheduler_msgs.Request.NEW]
+        pending_replies = replies_by_status[scheduler_msgs.Request.WAITING]
+        releasing_replies = replies_by_status[scheduler_msgs.Request.CANCELING]
         # get all requests for compatibility tree processing and sort by priority
         # this is a bit inefficient, should just sort the request set directly? modifying it directly may be not right though
         pending_replies[:] = sorted(pending_replies, key=lambda request: request.msg.priority)
@@ -315,25 +323,17 @@ class CompatibilityTreeScheduler(object):
         # this is basically equivalent to what is in the concert client changes
         # subscriber callback...can we move this somewhere centralised?
         for (resource_uri_string, request_id_hexstring) in reallocated_clients.iteritems():
-            request_id = uuid.UUID(request_id_hexstring)
-            # awkward that I don't have the requester id saved anywhere so
-            # we have to parse through each requester's set of requests to find
-            # the request id we want
-            found = False
-            for request_set in self._request_sets.values():
-                for request in request_set.values():
-                    if request.uuid == request_id:
-                        for resource in request.msg.resources:
-                            # could use a better way to check for equality than this
-                            if resource.uri == resource_uri_string:
-                                updated_resource_uri = rocon_uri.parse(resource_uri_string)
-                                updated_resource_uri.name = concert_msgs.Strings.SCHEDULER_UNALLOCATED_RESOURCE
-                                resource.uri = str(updated_resource_uri)
-                                found = True
-                                break
-                    if found:
-                        break
-                if found:
+            # the requester id isn't saved anywhere, so look the request up in the index built above
+            try:
+                (request_set, request) = replies_by_request_id[uuid.UUID(request_id_hexstring)]
+            except KeyError:
+                continue
+            for resource in request.msg.resources:
+                # could use a better way to check for equality than this
+                if resource.uri == resource_uri_string:
+                    updated_resource_uri = rocon_uri.parse(resource_uri_string)
+                    updated_resource_uri.name = concert_msgs.Strings.SCHEDULER_UNALLOCATED_RESOURCE
+                    resource.uri = str(updated_resource_uri)
                     if external_update:
                         pending_notifications.append(request_set.requester_id)
                     else:
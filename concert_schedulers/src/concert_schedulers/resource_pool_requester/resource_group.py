@@ -124,7 +124,7 @@ class ResourcePoolGroup(object):
             resource_tracker.reset_scheduler_flags()
 
     def find_resource_tracker(self, key):
-        if key in self._resources.keys():
+        if key in self._resources:
             return self._resources[key]
         else:
             return None
@@ -8,7 +8,8 @@
 
 import rospy
 import yaml
-import rocon_python_utils
+
+from .utils import YamlLoader, resolve_resource
 
 
 INVALID_PARAM = ['name', 'description', 'uuid']
@@ -23,13 +24,13 @@ def load_parameters_from_key_value_msg(parameter_key_value_msg, namespace, name,
         load_parameter(kv.key, kv.value, namespace, name, load)
 
 def load_parameters_from_resource(parameter_resource_name, namespace, name, load):
-    filepath = rocon_python_utils.ros.find_resource_from_string(parameter_resource_name, extension='parameters')
+    filepath = resolve_resource(parameter_resource_name, extension='parameters')
     load_parameters_from_file(filepath, namespace, name, load)
 
 def load_parameters_from_file(parameter_file_path, namespace, name, load):
     filepath = parameter_file_path
     with open(filepath) as f:
-        params = yaml.load(f)
+        params = yaml.load(f, Loader=YamlLoader)
         for k, v in params.items():
             load_parameter(k, v, namespace, name, load)
 
@@ -187,7 +187,7 @@ class ServiceInstance(object):
     def _start_roslaunch(self):
         try:
             force_screen = rospy.get_param(concert_msgs.Strings.PARAM_ROCON_SCREEN, True)
-            roslaunch_file_path = rocon_python_utils.ros.find_resource_from_string(self.msg.launcher, extension='launch')
+            roslaunch_file_path = resolve_resource(self.msg.launcher, extension='launch')
             temp = tempfile.NamedTemporaryFile(mode='w+t', delete=False)
             launch_text = self._prepare_launch_text(roslaunch_file_path, self._namespace)
             temp.write(launch_text)
@@ -75,7 +75,7 @@ class ServiceManager(object):
         for cached_service in cached_solution_config.values():
             name = cached_service['name']
             enabled = cached_service['enabled']
-            if name in self._service_pool.service_profiles.keys():
+            if name in self._service_pool.service_profiles:
                 if enabled is True:
                     self._ros_service_enable_concert_service(concert_srvs.EnableServiceRequest(name, True))
                 elif enabled is None:
@@ -92,7 +92,7 @@ class ServiceManager(object):
                 self._ros_service_enable_concert_service(concert_srvs.EnableServiceRequest(name, True))
         elif type(self._parameters['default_auto_enable_services']) is list:
             for name in self._parameters['default_auto_enable_services']:
-                if name in self._service_pool.service_profiles.keys():
+                if name in self._service_pool.service_profiles:
                     self._ros_service_enable_concert_service(concert_srvs.EnableServiceRequest(name, True))
                 else:
                     rospy.logwarn("Service Manager : '%s' is not available. cannot auto enable" % str(name))
@@ -148,7 +148,7 @@ class ServiceManager(object):
         service_profile = req.service_profile
         service_name = service_profile.name
         # write at cache
-        if service_name in self._enabled_services.keys():
+        if service_name in self._enabled_services:
             success = False
             message = "%s service is running. First, stop %s service" % (service_name, service_name)
         else:
@@ -173,7 +173,7 @@ class ServiceManager(object):
             if req.enable:
                 self._service_pool.reload_services()
                 # Check if the service name is in the currently loaded service profiles
-                if name not in self._enabled_services.keys():
+                if name not in self._enabled_services:
                     try:
                         service_instance = ServiceInstance(self._parameters['concert_name'], self._parameters['disable_cache'], self._service_pool.find(name).msg)
                     except NoServiceExistsException:
@@ -213,7 +213,7 @@ class ServiceManager(object):
         '''
         services = [service_profile.msg for service_profile in self._service_pool.service_profiles.values()]
         for service in services:
-            service.enabled = True if service.name in self._enabled_services.keys() else False
+            service.enabled = True if service.name in self._enabled_services else False
         self._service_pool.update_solution_configuration(services)
         self._publishers['list_concert_services'].publish(services)
 
@@ -10,6 +10,7 @@ import os.path
 import time
 import yaml
 import copy
+from multiprocessing.pool import ThreadPool
 
 import rospkg
 import roslib.names
@@ -27,6 +28,23 @@ from .exceptions import InvalidServiceProfileException, NoServiceExistsException
 from .utils import *
 
 
+def _read_service_profile(service_profile_args):
+    """
+      Construct a service profile, swallowing missing resources so that one
+      broken profile doesn't take down the rest of a batch being read in parallel.
+
+      :param service_profile_args: keyword arguments for the :class:`.ServiceProfile` constructor
+      :type service_profile_args: dict
+
+      :returns: the service profile or None if some of its resources could not be found
+      :rtype: :class:`.ServiceProfile`
+    """
+    try:
+        return ServiceProfile(**service_profile_args)
+    except rospkg.ResourceNotFound:
+        return None
+
+
 def load_solution_configuration_from_default(yaml_file):
     """
       Load the solution configuration from a yaml file. This is a pretty
@@ -49,27 +67,26 @@ def load_solution_configuration_from_default(yaml_file):
 
     # read
     override_keys = ['name', 'description', 'icon', 'priority', 'interactions', 'parameters']
-    with open(yaml_file) as f:
-        service_list = yaml.load(f)
-        for s in service_list:
-            service_data = {}
-            service_data['resource_name'] = s['resource_name']
-            loaded_overrides = s['overrides'] if 'overrides' in s else None
-            overrides = {}
-            for key in override_keys:
-                overrides[key] = loaded_overrides[key] if loaded_overrides and key in loaded_overrides.keys() else None
-            # warnings
-            if loaded_overrides:
-                invalid_keys = [key for key in loaded_overrides.keys() if key not in override_keys]
-                for key in invalid_keys:
-                    rospy._logwarn("invalid key in the service soln configuration yaml [%s]" % key)
-            service_data['overrides'] = copy.deepcopy(overrides)
-            service_configurations.append(service_data)
+    service_list = load_yaml_file(yaml_file)
+    for s in service_list:
+        service_data = {}
+        service_data['resource_name'] = s['resource_name']
+        loaded_overrides = s['overrides'] if 'overrides' in s else None
+        overrides = {}
+        for key in override_keys:
+            overrides[key] = loaded_overrides[key] if loaded_overrides and key in loaded_overrides else None
+        # warnings
+        if loaded_overrides:
+            invalid_keys = [key for key in loaded_overrides.keys() if key not in override_keys]
+            for key in invalid_keys:
+                rospy._logwarn("invalid key in the service soln configuration yaml [%s]" % key)
+        service_data['overrides'] = copy.deepcopy(overrides)
+        service_configurations.append(service_data)
 
     # validate
     identifiers = []
     for service_data in service_configurations:
-        if service_data['overrides']['name'] is not None and 'name' in service_data['overrides'].keys():
+        if service_data['overrides']['name'] is not None and 'name' in service_data['overrides']:
             identifier = service_data['overrides']['name']
         else:
             identifier = service_data['resource_name']
@@ -97,6 +114,8 @@ class ServicePool(object):
         '_solution_config_file',      # full path of loaded solution configuration file
     ]
 
+    max_reader_threads = 8  # upper limit on the number of service profiles read in parallel
+
     def __init__(self, concert_name, resource_name, disable_cache, modification_callback=None):
         self._concert_name = rocon_python_utils.ros.get_ros_friendly_name(concert_name)
         self._resource_name = resource_name
@@ -133,20 +152,15 @@ class ServicePool(object):
         :rtype: str
 
         """
-        default_service_config_file = rocon_python_utils.ros.find_resource_from_string(self._resource_name)
+        default_service_config_file = resolve_resource(self._resource_name)
         loaded_solution_config = load_solution_configuration_from_default(default_service_config_file)
+        service_profile_args = []
         for service in loaded_solution_config:
-            service_profile_file = rocon_python_utils.ros.check_extension_name(service['resource_name'], '.service')
-            overrides = service['overrides']
-            try:
-                read_profile = ServiceProfile(concert_name=self._concert_name,
-                                              is_read_from_default=True,
-                                              service_profile_file=service_profile_file,
-                                              overrides=overrides)
-                self.service_profiles[read_profile.name] = read_profile
-            except rospkg.ResourceNotFound as e:
-                self._logwarn('cannot load service profile: [%s]' % service_profile_file)
-                continue
+            service_profile_args.append({'concert_name': self._concert_name,
+                                         'is_read_from_default': True,
+                                         'service_profile_file': rocon_python_utils.ros.check_extension_name(service['resource_name'], '.service'),
+                                         'overrides': service['overrides']})
+        self._read_service_profiles(service_profile_args)
         return default_service_config_file
 
     def _load_service_profiles_from_cache(self):
@@ -164,25 +178,43 @@ class ServicePool(object):
             self._loginfo("create cache file: [%s]" % cached_solution_config_file)
             self._create_cache()
 
-        with open(cached_solution_config_file) as f:
-            service_list = yaml.load(f)
-            for service in service_list:
-                name = service['name']
-                enabled = service['enabled']
-                service_profile_file = os.path.join(get_service_profile_cache_home(self._concert_name, service['name']), rocon_python_utils.ros.check_extension_name(service['name'], '.service'))
-                try:
-                    read_profile = ServiceProfile(concert_name=self._concert_name,
-                                                  is_read_from_default=False,
-                                                  service_profile_file=service_profile_file,
-                                                  overrides=None,
-                                                  enabled=enabled)
-                    self.service_profiles[read_profile.name] = read_profile
-                except rospkg.ResourceNotFound as e:
-                    self._logwarn('cannot load service profile: [%s]' % service_profile_file)
-                    continue
+        service_list = load_yaml_file(cached_solution_config_file)
+        service_profile_args = []
+        for service in service_list:
+            service_profile_args.append({'concert_name': self._concert_name,
+                                         'is_read_from_default': False,
+                                         'service_profile_file': os.path.join(get_service_profile_cache_home(self._concert_name, service['name']), rocon_python_utils.ros.check_extension_name(service['name'], '.service')),
+                                         'overrides': None,
+                                         'enabled': service['enabled']})
+        self._read_service_profiles(service_profile_args)
 
         return cached_solution_config_file
 
+    def _read_service_profiles(self, service_profile_args):
+        """
+        Read a batch of service profiles in parallel (resource lookups and yaml parsing
+        for each are independent) and register them in this pool. Registration is done
+        back in the calling thread. Yaml parsing holds the GIL, so the gain is mostly
+        in overlapping the file reads.
+
+        :param service_profile_args: keyword arguments for each :class:`.ServiceProfile` to be read
+        :type service_profile_args: [dict]
+        """
+        if not service_profile_args:
+            return
+        warm_resource_cache()  # workers share the rospack, don't let them race on its first crawl
+        pool = ThreadPool(min(ServicePool.max_reader_threads, len(service_profile_args)))
+        try:
+            read_profiles = pool.map(_read_service_profile, service_profile_args)
+        finally:
+            pool.close()
+            pool.join()
+        for args, read_profile in zip(service_profile_args, read_profiles):
+            if read_profile is None:
+                self._logwarn('cannot load service profile: [%s]' % args['service_profile_file'])
+            else:
+                self.service_profiles[read_profile.name] = read_profile
+
     def _check_cache(self):
         """
           Check whether cached yaml files regarding service profile and solution config are already generated or not
@@ -195,22 +227,21 @@ class ServicePool(object):
         """
         is_cached_solution_config = True
         try:
-            default_solution_configuration_file = rocon_python_utils.ros.find_resource_from_string(self._resource_name)
+            default_solution_configuration_file = resolve_resource(self._resource_name)
         except rospkg.ResourceNotFound as e:
             raise e
         solution_configuration_file_name = default_solution_configuration_file.split('/')[-1]
         cached_solution_configuration_file = get_concert_home(self._concert_name) + '/' + solution_configuration_file_name
         if rocon_python_utils.ros.is_validation_file(cached_solution_configuration_file):
-            with open(cached_solution_configuration_file) as f:
-                service_list = yaml.load(f)
-                for service in service_list:
-                    service_file_name = os.path.join(get_service_profile_cache_home(self._concert_name, service['name']), rocon_python_utils.ros.check_extension_name(service['name'], '.service'))
-                    if not rocon_python_utils.ros.is_validation_file(service_file_name):
-                        is_cached_solution_config = False
-                        self._logwarn("Broken service profile files!!")
-                        break
-                    else:
-                        is_cached_solution_config = True
+            service_list = load_yaml_file(cached_solution_configuration_file)
+            for service in service_list:
+                service_file_name = os.path.join(get_service_profile_cache_home(self._concert_name, service['name']), rocon_python_utils.ros.check_extension_name(service['name'], '.service'))
+                if not rocon_python_utils.ros.is_validation_file(service_file_name):
+                    is_cached_solution_config = False
+                    self._logwarn("Broken service profile files!!")
+                    break
+                else:
+                    is_cached_solution_config = True
         else:
             is_cached_solution_config = False
             self._logwarn("No cached solution config file!!")
@@ -254,7 +285,7 @@ class ServicePool(object):
         for sp in self.service_profiles.values():
             solution_config[sp.name] = {'name': sp.name, 'enabled': sp.enabled}
         # write solution config file
-        default_solution_config_file = rocon_python_utils.ros.find_resource_from_string(self._resource_name).split('/')[-1]
+        default_solution_config_file = resolve_resource(self._resource_name).split('/')[-1]
         cache_solution_config_file = get_concert_home(self._concert_name) + '/' + default_solution_config_file
         with file(cache_solution_config_file, 'w') as f:
             yaml.safe_dump(solution_config.values(), f, default_flow_style=False)
@@ -274,7 +305,7 @@ class ServicePool(object):
         service_profile_cache_home = get_service_profile_cache_home(self._concert_name, service_name)
 
         # writting interaction data
-        if 'interactions_detail' in loaded_profile.keys():
+        if 'interactions_detail' in loaded_profile:
             service_interactions_file_name = os.path.join(service_profile_cache_home, rocon_python_utils.ros.check_extension_name(service_name, '.interactions'))
             loaded_profile['interactions'] = service_interactions_file_name.split('/')[-1]
             with file(service_interactions_file_name, 'w') as f:
@@ -282,7 +313,7 @@ class ServicePool(object):
             del (loaded_profile['interactions_detail'])
 
         # writting parameter data
-        if 'parameters_detail' in loaded_profile.keys():
+        if 'parameters_detail' in loaded_profile:
             service_parameters_file_name = os.path.join(service_profile_cache_home, rocon_python_utils.ros.check_extension_name(service_name, '.parameters'))
             loaded_profile['parameters'] = service_parameters_file_name.split('/')[-1]
             with file(service_parameters_file_name, 'w') as f:
@@ -290,7 +321,7 @@ class ServicePool(object):
             del (loaded_profile['parameters_detail'])
 
         # delete msg key
-        if 'msg' in loaded_profile.keys():
+        if 'msg' in loaded_profile:
             del (loaded_profile['msg'])
 
         # writting service profile data
@@ -386,7 +417,7 @@ class ServicePool(object):
             for param_pair in service_profile['parameters_detail']:
                 service_parameter_detail[param_pair['key']] = param_pair['value']
 
-            if service_profile['name'] in self.service_profiles.keys():
+            if service_profile['name'] in self.service_profiles:
                 service_profile = self.service_profiles[service_profile['name']].service_profile
                 service_profile['parameters_detail'] = service_parameter_detail
                 try:
@@ -7,7 +7,6 @@
 
 import os
 import time
-import yaml
 import copy
 import json
 
@@ -22,6 +21,9 @@ import rocon_std_msgs.msg as rocon_std_msgs
 import concert_msgs.msg as concert_msgs
 from .utils import *
 
+# service profile keys that are copied as is into the concert_msgs.ServiceProfile fields of the same name
+PROFILE_MSG_FIELDS = ['resource_name', 'name', 'description', 'author', 'priority', 'launcher_type', 'launcher', 'interactions', 'parameters']
+
 ##############################################################################
 # Classes
 ##############################################################################
@@ -112,35 +114,13 @@ class ServiceProfile(object):
         """
         msg = concert_msgs.ServiceProfile()
         msg.uuid = unique_id.toMsg(unique_id.fromRandom())
-        # todo change more nice method
-        if 'resource_name' in loaded_profile:
-            msg.resource_name = loaded_profile['resource_name']
-        if 'name' in loaded_profile:
-            msg.name = loaded_profile['name']
-        if 'description' in loaded_profile:
-            msg.description = loaded_profile['description']
-        if 'author' in loaded_profile:
-            msg.author = loaded_profile['author']
-        if 'priority' in loaded_profile:
-            msg.priority = loaded_profile['priority']
-        if 'launcher_type' in loaded_profile:
-            msg.launcher_type = loaded_profile['launcher_type']
+        for field in PROFILE_MSG_FIELDS:
+            if field in loaded_profile:
+                setattr(msg, field, loaded_profile[field])
         if 'icon' in loaded_profile:
             msg.icon = rocon_python_utils.ros.icon_resource_to_msg(loaded_profile['icon'])
-        if 'launcher' in loaded_profile:
-            msg.launcher = loaded_profile['launcher']
-        if 'interactions' in loaded_profile:
-            msg.interactions = loaded_profile['interactions']
-        if 'parameters' in loaded_profile:
-            msg.parameters = loaded_profile['parameters']
         if 'parameters_detail' in loaded_profile:
-            for param_key in loaded_profile['parameters_detail'].keys():
-                msg.parameters_detail.append(rocon_std_msgs.KeyValue(param_key, str(loaded_profile['parameters_detail'][param_key])))
-                # t = type(loaded_profile['parameters_detail'][param_key])
-                # if t is list or t is dict:
-                #     msg.parameters_detail.append(rocon_std_msgs.KeyValue(param_key, eval(loaded_profile['parameters_detail'][param_key])))
-                # else:
-                #     msg.parameters_detail.append(rocon_std_msgs.KeyValue(param_key, str(loaded_profile['parameters_detail'][param_key])))
+            msg.parameters_detail = [rocon_std_msgs.KeyValue(key, str(value)) for key, value in loaded_profile['parameters_detail'].items()]
         return msg
 
     def _read_service_profile_from_default(self):
@@ -159,41 +139,36 @@ class ServiceProfile(object):
         overrides = copy.deepcopy(self._overrides)
 
         try:
-            file_name = rocon_python_utils.ros.find_resource_from_string(service_file_name)
-            with open(file_name) as f:
-                loaded_profile = yaml.load(f)
+            file_name = resolve_resource(service_file_name)
+            loaded_profile = load_yaml_file(file_name)
             self._profile_files.append([file_name, time.ctime(os.path.getmtime(file_name))])
         except rospkg.ResourceNotFound as e:
             raise e
         loaded_profile['resource_name'] = service_file_name
 
         # set priority to default if it was not configured
-        if 'priority' not in loaded_profile.keys():
+        if 'priority' not in loaded_profile:
             loaded_profile['priority'] = scheduler_msgs.Request.DEFAULT_PRIORITY
         for key in loaded_profile:
             if key in overrides and overrides[key] is not None:
                 loaded_profile[key] = overrides[key]
-        if 'launcher_type' not in loaded_profile.keys():  # not set
+        if 'launcher_type' not in loaded_profile:  # not set
             loaded_profile['launcher_type'] = concert_msgs.ServiceProfile.TYPE_SHADOW
         loaded_profile['name'] = rocon_python_utils.ros.get_ros_friendly_name(loaded_profile['name'])
 
-        if 'parameters' in loaded_profile.keys():
+        if 'parameters' in loaded_profile:
             loaded_profile['parameters_detail'] = []
             try:
-                parameters_yaml_file = rocon_python_utils.ros.find_resource_from_string(rocon_python_utils.ros.check_extension_name(loaded_profile['parameters'], '.parameters'))
-                with open(parameters_yaml_file) as f:
-                    parameters_yaml = yaml.load(f)
-                    loaded_profile['parameters_detail'] = parameters_yaml
+                parameters_yaml_file = resolve_resource(rocon_python_utils.ros.check_extension_name(loaded_profile['parameters'], '.parameters'))
+                loaded_profile['parameters_detail'] = load_yaml_file(parameters_yaml_file)
                 self._profile_files.append([parameters_yaml_file, time.ctime(os.path.getmtime(parameters_yaml_file))])
             except rospkg.ResourceNotFound as e:
                 raise e
 
-        if 'interactions' in loaded_profile.keys():
+        if 'interactions' in loaded_profile:
             try:
-                interactions_yaml_file = rocon_python_utils.ros.find_resource_from_string(rocon_python_utils.ros.check_extension_name(loaded_profile['interactions'], '.interactions'))
-                with open(interactions_yaml_file) as f:
-                    interactions_yaml = yaml.load(f)
-                    loaded_profile['interactions_detail'] = interactions_yaml
+                interactions_yaml_file = resolve_resource(rocon_python_utils.ros.check_extension_name(loaded_profile['interactions'], '.interactions'))
+                loaded_profile['interactions_detail'] = load_yaml_file(interactions_yaml_file)
                 self._profile_files.append([interactions_yaml_file, time.ctime(os.path.getmtime(interactions_yaml_file))])
             except rospkg.ResourceNotFound as e:
                 raise e
@@ -218,26 +193,21 @@ class ServiceProfile(object):
             raise rospkg.ResourceNotFound("can not find service file in cache [%s]" % service_file_name)
         else:
             self._profile_files.append([service_file_name, time.ctime(os.path.getmtime(service_file_name))])
-            with open(service_file_name) as f:
-                loaded_profile = yaml.load(f)
-                if 'parameters' in loaded_profile.keys():
-                    loaded_profile['parameters_detail'] = []
-                    parameters_yaml_file = os.path.join(get_service_profile_cache_home(concert_name, loaded_profile['name']), loaded_profile['parameters'])
-                    if not rocon_python_utils.ros.is_validation_file(parameters_yaml_file):
-                        raise rospkg.ResourceNotFound("can not find parameters file in cache [%s]" % parameters_yaml_file)
-                    self._profile_files.append([parameters_yaml_file, time.ctime(os.path.getmtime(parameters_yaml_file))])
-                    with open(parameters_yaml_file) as f:
-                        parameters_yaml = yaml.load(f)
-                        loaded_profile['parameters_detail'] = parameters_yaml
-                if 'interactions' in loaded_profile.keys():
-                    loaded_profile['interactions_detail'] = []
-                    interactions_yaml_file = os.path.join(get_service_profile_cache_home(concert_name, loaded_profile['name']), loaded_profile['interactions'])
-                    if not rocon_python_utils.ros.is_validation_file(interactions_yaml_file):
-                        raise rospkg.ResourceNotFound("can not find interactions file in cache [%s]" % interactions_yaml_file)
-                    self._profile_files.append([interactions_yaml_file, time.ctime(os.path.getmtime(interactions_yaml_file))])
-                    with open(interactions_yaml_file) as f:
-                        interactions_yaml = yaml.load(f)
-                        loaded_profile['interactions_detail'] = interactions_yaml
+            loaded_profile = load_yaml_file(service_file_name)
+            if 'parameters' in loaded_profile:
+                loaded_profile['parameters_detail'] = []
+                parameters_yaml_file = os.path.join(get_service_profile_cache_home(concert_name, loaded_profile['name']), loaded_profile['parameters'])
+                if not rocon_python_utils.ros.is_validation_file(parameters_yaml_file):
+                    raise rospkg.ResourceNotFound("can not find parameters file in cache [%s]" % parameters_yaml_file)
+                self._profile_files.append([parameters_yaml_file, time.ctime(os.path.getmtime(parameters_yaml_file))])
+                loaded_profile['parameters_detail'] = load_yaml_file(parameters_yaml_file)
+            if 'interactions' in loaded_profile:
+                loaded_profile['interactions_detail'] = []
+                interactions_yaml_file = os.path.join(get_service_profile_cache_home(concert_name, loaded_profile['name']), loaded_profile['interactions'])
+                if not rocon_python_utils.ros.is_validation_file(interactions_yaml_file):
+                    raise rospkg.ResourceNotFound("can not find interactions file in cache [%s]" % interactions_yaml_file)
+                self._profile_files.append([interactions_yaml_file, time.ctime(os.path.getmtime(interactions_yaml_file))])
+                loaded_profile['interactions_detail'] = load_yaml_file(interactions_yaml_file)
         return loaded_profile
 
     def _loginfo(self, msg):
@@ -7,15 +7,91 @@
 # Imports
 ##############################################################################
 
+import copy
 import os
+import threading
 import rocon_python_utils
 import rospkg
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml bindings, much faster
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+_loaded_yaml_files = {}  # { full path : ((mtime, size), loaded yaml) }
+_rospack = rospkg.RosPack()  # shared so its package location cache is reused across lookups, see warm_resource_cache()
+_resource_paths = {}  # { (resource name, extension) : full path }
+_rospack_lock = threading.RLock()  # only one thread at a time replaces the shared rospack
 
 ##############################################################################
 # Methods
 ##############################################################################
 
 
+def resolve_resource(resource_name, extension=None):
+    '''
+      Find the full path of a resource (e.g. 'concert_service_manager/valid.service')
+      in the ros package path. Results are remembered, so repeated lookups of the same
+      resource don't crawl the package path again. A remembered path is dropped if the
+      file has since disappeared. If the resource can't be found, the package path is
+      crawled afresh (it may be in a package added since) and the lookup tried once more.
+
+      All lookups share one rospack that crawls the package path lazily, and not
+      atomically, on first use. Call warm_resource_cache() before resolving from
+      several threads, otherwise they can see a half filled package location cache
+      and get a spurious rospkg.ResourceNotFound.
+
+      @param resource_name : resource name ('package/filename')
+      @type str
+
+      @param extension : file extension to check for/append, if any
+      @type str
+
+      @return full path to the resource
+      @rtype str
+
+      @raise rospkg.ResourceNotFound : if the resource could not be found
+    '''
+    key = (resource_name, extension)
+    path = _resource_paths.get(key)
+    if path is not None and os.path.isfile(path):
+        return path
+    rospack = _rospack
+    try:
+        path = rocon_python_utils.ros.find_resource_from_string(resource_name, rospack=rospack, extension=extension)
+    except rospkg.ResourceNotFound:
+        with _rospack_lock:
+            if _rospack is rospack:  # another thread may have already refreshed it
+                clear_resource_cache()
+        path = rocon_python_utils.ros.find_resource_from_string(resource_name, rospack=_rospack, extension=extension)
+    _resource_paths[key] = path
+    return path
+
+
+def warm_resource_cache():
+    '''
+      Crawl the ros package path up front. The shared rospack fills its package
+      location cache lazily and not atomically, so do this before resolving
+      resources from several threads at once.
+    '''
+    _rospack.list()
+
+
+def clear_resource_cache():
+    '''
+      Forget all remembered resource paths and package locations, e.g. after the ros
+      package path has changed. The replacement rospack is crawled before it is shared,
+      so threads resolving concurrently never see it half filled.
+    '''
+    global _rospack
+    with _rospack_lock:
+        rospack = rospkg.RosPack()
+        rospack.list()
+        _resource_paths.clear()
+        _rospack = rospack
+
+
 def get_concert_home(concert_name):
     '''
       Retrieve the location of the home directory for the service manager
@@ -45,3 +121,30 @@ def get_service_profile_cache_home(concert_name, service_name):
     if not os.path.isdir(service_profile_cache_home):
         os.makedirs(service_profile_cache_home)
     return service_profile_cache_home
+
+
+def load_yaml_file(filename):
+    '''
+      Load a yaml file. The parsed contents are kept in memory and reused as long
+      as the file's modification time and size do not change, so unchanged service
+      profiles are not parsed again on every reload.
+
+      @param filename : full path to the yaml file
+      @type str
+
+      @return a copy of the loaded yaml, safe for the caller to modify
+      @rtype dict or list
+
+      @raise IOError : if the file could not be opened
+    '''
+    with open(filename) as f:
+        stat = os.fstat(f.fileno())
+        signature = (stat.st_mtime, stat.st_size)
+        try:
+            cached_signature, loaded_yaml = _loaded_yaml_files[filename]
+        except KeyError:
+            cached_signature = None
+        if cached_signature != signature:
+            loaded_yaml = yaml.load(f, Loader=YamlLoader)
+            _loaded_yaml_files[filename] = (signature, loaded_yaml)
+    return copy.deepcopy(loaded_yaml)
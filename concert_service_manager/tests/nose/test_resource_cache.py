@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+#
+# License: BSD
+#   https://raw.github.com/robotics-in-concert/rocon_concert/license/LICENSE
+#
+
+##############################################################################
+# Imports
+##############################################################################
+
+# enable some python3 compatibility options:
+# (unicode_literals not compatible with python2 uuid module)
+from __future__ import absolute_import, print_function
+
+import os
+import shutil
+import tempfile
+
+from nose.tools import assert_raises
+
+import rospkg
+
+import concert_service_manager.utils as utils
+
+import rocon_console.console as console
+
+##############################################################################
+# Tests
+##############################################################################
+
+def test_resolve_resource():
+    print(console.bold + "\n****************************************************************************************" + console.reset)
+    print(console.bold + "* Resource Path Cache" + console.reset)
+    print(console.bold + "****************************************************************************************" + console.reset)
+    print("")
+    workspace = tempfile.mkdtemp()
+    locations = [os.path.join(workspace, 'first.service'), os.path.join(workspace, 'second.service')]
+    for location in locations:
+        open(location, 'w').close()
+    lookups = []
+    stale_rospacks = []  # rospacks crawled before 'babbler_services' was installed
+
+    def find_resource_from_string(resource_name, rospack=None, extension=None):
+        lookups.append(resource_name)
+        if resource_name.startswith('missing_services/'):
+            raise rospkg.ResourceNotFound(resource_name)
+        if resource_name.startswith('babbler_services/') and rospack in stale_rospacks:
+            raise rospkg.ResourceNotFound(resource_name)
+        return locations[0] if os.path.isfile(locations[0]) else locations[1]
+
+    original_find_resource_from_string = utils.rocon_python_utils.ros.find_resource_from_string
+    utils.rocon_python_utils.ros.find_resource_from_string = find_resource_from_string
+    utils.clear_resource_cache()
+    try:
+        # repeated lookups are remembered
+        assert utils.resolve_resource('concert_service_manager/chatter.service') == locations[0]
+        assert utils.resolve_resource('concert_service_manager/chatter.service') == locations[0]
+        assert len(lookups) == 1
+        # a remembered path whose file has gone is resolved again
+        os.remove(locations[0])
+        assert utils.resolve_resource('concert_service_manager/chatter.service') == locations[1]
+        assert len(lookups) == 2
+        assert utils.resolve_resource('concert_service_manager/chatter.service') == locations[1]
+        assert len(lookups) == 2
+        # clearing starts afresh with a new rospack
+        rospack = utils._rospack
+        utils.clear_resource_cache()
+        assert utils._rospack is not rospack
+        assert utils.resolve_resource('concert_service_manager/chatter.service') == locations[1]
+        assert len(lookups) == 3
+        # a package installed since the last crawl is found by crawling again
+        stale_rospacks.append(utils._rospack)
+        assert utils.resolve_resource('babbler_services/babbler.service') == locations[1]
+        assert utils._rospack not in stale_rospacks
+        assert len(lookups) == 5
+        # a resource that really is missing is only looked for again the once
+        assert_raises(rospkg.ResourceNotFound, utils.resolve_resource, 'missing_services/missing.service')
+        assert len(lookups) == 7
+    finally:
+        utils.rocon_python_utils.ros.find_resource_from_string = original_find_resource_from_string
+        utils.clear_resource_cache()
+        shutil.rmtree(workspace)
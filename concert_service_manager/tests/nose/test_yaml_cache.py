@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+#
+# License: BSD
+#   https://raw.github.com/robotics-in-concert/rocon_concert/license/LICENSE
+#
+
+##############################################################################
+# Imports
+##############################################################################
+
+# enable some python3 compatibility options:
+# (unicode_literals not compatible with python2 uuid module)
+from __future__ import absolute_import, print_function
+
+from nose.tools import assert_raises
+
+import os
+import tempfile
+
+from concert_service_manager import load_yaml_file
+
+import rocon_console.console as console
+
+##############################################################################
+# Tests
+##############################################################################
+
+def test_load_yaml_file():
+    print(console.bold + "\n****************************************************************************************" + console.reset)
+    print(console.bold + "* Yaml File Cache" + console.reset)
+    print(console.bold + "****************************************************************************************" + console.reset)
+    print("")
+    (fd, filename) = tempfile.mkstemp(suffix='.yaml')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write("name: chatter\npriority: 5\n")
+        loaded = load_yaml_file(filename)
+        assert loaded == {'name': 'chatter', 'priority': 5}
+        # callers get their own copy to mangle
+        loaded['name'] = 'babbler'
+        assert load_yaml_file(filename)['name'] == 'chatter'
+        # changes on disk are picked up
+        with open(filename, 'w') as f:
+            f.write("name: babbler\npriority: 10\n")
+        os.utime(filename, (0, 0))
+        assert load_yaml_file(filename) == {'name': 'babbler', 'priority': 10}
+    finally:
+        os.remove(filename)
+    assert_raises(IOError, load_yaml_file, filename)
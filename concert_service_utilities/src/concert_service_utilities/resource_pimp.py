@@ -94,20 +94,21 @@ class ResourcePimp(object):
           :param msg: incoming message
           :type msg: scheduler_msgs.KnownResources
         '''
-        # find difference of incoming and stored lists based on unique concert names
-        diff = lambda l1, l2: [x for x in l1 if x.uri not in [l.uri for l in l2]]
         # get all currently invited teleopable robots
-        available_resources = [r for r in msg.resources if self.resource_type in r.rapps and r.status == scheduler_msgs.CurrentStatus.AVAILABLE]
-        preemptible_resources = [r for r in msg.resources if self.resource_type in r.rapps and r.status == scheduler_msgs.CurrentStatus.ALLOCATED and r.priority < self.service_priority]
+        candidates = [r for r in msg.resources if self.resource_type in r.rapps]
+        available_resources = [r for r in candidates if r.status == scheduler_msgs.CurrentStatus.AVAILABLE]
+        preemptible_resources = [r for r in candidates if r.status == scheduler_msgs.CurrentStatus.ALLOCATED and r.priority < self.service_priority]
         resources = available_resources + preemptible_resources
         self.lock.acquire()
-        new_resources = diff(resources, self.available_resources)
-        lost_resources = diff(self.available_resources, resources)
-        for resource in new_resources:
-            self.available_resources.append(resource)
-        for resource in lost_resources:
-            # rebuild list in place without lost client
-            self.available_resources[:] = [r for r in self.available_resources if resource.uri != r.uri]
+        # find difference of incoming and stored lists based on unique concert names
+        incoming_uris = set(r.uri for r in resources)
+        stored_uris = set(r.uri for r in self.available_resources)
+        new_resources = [r for r in resources if r.uri not in stored_uris]
+        lost_uris = stored_uris - incoming_uris
+        self.available_resources.extend(new_resources)
+        if lost_uris:
+            # rebuild list in place without lost clients
+            self.available_resources[:] = [r for r in self.available_resources if r.uri not in lost_uris]
         self.lock.release()
         self.publish_available_resources()
 
@@ -134,8 +135,11 @@ class ResourcePimp(object):
                 if request_id in self.pending_requests:
                     self.pending_requests.remove(request_id)
             elif request.msg.status == scheduler_msgs.Request.CLOSED:
-                self.pending_requests.remove(request_id)
-                self.allocated_requests.remove(request_id)
+                if request_id in self.pending_requests:
+                    self.pending_requests.remove(request_id)
+                # allocated_requests is keyed by resource uri, not request id
+                for uri in [u for u, allocated_request_id in self.allocated_requests.items() if allocated_request_id == request_id]:
+                    del self.allocated_requests[uri]
 
     def cancel_all_requests(self):
         '''
@@ -179,7 +183,7 @@ class ResourcePimp(object):
             return True, resource_request_id
 
     def send_releasing_request(self, uri):
-        if uri in self.allocated_requests.keys():
+        if uri in self.allocated_requests:
             self.loginfo("released teleopable robot [%s][%s]" % (uri, self.allocated_requests[uri].hex))
             self.requester.rset[self.allocated_requests[uri]].cancel()
             self.requester.send_requests()
@@ -167,7 +167,7 @@ def console_only_main(node_name='concert_service_info', title='Concert Service I
 
 
 def main(node_name='concert_service_info', title='Concert Service Information', console=True):
-    display_available = True if 'DISPLAY' in os.environ.keys() else False
+    display_available = 'DISPLAY' in os.environ
     try:
         from rqt_gui.main import Main
         qt_available = True
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#
+# License: BSD
+#   https://raw.github.com/robotics-in-concert/rocon_concert/license/LICENSE
+#
+##############################################################################
+# Imports
+##############################################################################
+
+# enable some python3 compatibility options:
+# (unicode_literals not compatible with python2 uuid module)
+from __future__ import absolute_import, print_function
+
+import uuid
+
+import scheduler_msgs.msg as scheduler_msgs
+
+from concert_service_utilities import ResourcePimp
+
+##############################################################################
+# Helpers
+##############################################################################
+
+
+class FakeRequest(object):
+
+    def __init__(self, status):
+        self.msg = scheduler_msgs.Request(status=status)
+
+
+class FakeRequestSet(object):
+
+    def __init__(self, requests):
+        self.requests = requests
+
+
+class FakeResourcePimp(ResourcePimp):
+    '''
+      Skips the ros setup in the constructor, only feedback handling is exercised.
+    '''
+    def __init__(self):
+        self.pending_requests = []
+        self.allocated_requests = {}
+
+##############################################################################
+# Tests
+##############################################################################
+
+
+def test_requester_feedback_closed():
+    print("\n****************************************************************************************")
+    print("* Requester Feedback - Closed Requests")
+    print("****************************************************************************************")
+    print("")
+    closed_id = uuid.uuid4()
+    other_id = uuid.uuid4()
+    pimp = FakeResourcePimp()
+    pimp.pending_requests = [closed_id, other_id]
+    pimp.allocated_requests = {'rocon:/turtlebot/kobuki': closed_id, 'rocon:/turtlebot/guimul': other_id}
+    pimp.requester_feedback(FakeRequestSet({closed_id: FakeRequest(scheduler_msgs.Request.CLOSED)}))
+    assert pimp.pending_requests == [other_id]
+    assert pimp.allocated_requests == {'rocon:/turtlebot/guimul': other_id}
+    # closing an unknown request is harmless
+    pimp.requester_feedback(FakeRequestSet({uuid.uuid4(): FakeRequest(scheduler_msgs.Request.CLOSED)}))
+    assert pimp.pending_requests == [other_id]
+    assert pimp.allocated_requests == {'rocon:/turtlebot/guimul': other_id}
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+import threading
+
 import rospy
 import rocon_python_comms
 import concert_msgs.srv as concert_srvs
@@ -10,9 +12,29 @@ class FailedToStartSoftwareException(Exception):
 
 class SoftwareFarmClient(object):
 
+    __slots__ = [
+        '_node_name',               # name of this node, identifies the user of the software
+        '_software_farm_srv_name',  # name of the software farmer's allocate service
+        '_software_farm_srv',       # persistent service proxy to the software farmer's allocate service
+        '_lock',                    # serialise calls, the proxy's single connection can't carry interleaved requests
+    ]
+
     def __init__(self):
-        software_farm_srv_name = rocon_python_comms.find_service('concert_msgs/AllocateSoftware', timeout=rospy.rostime.Duration(5.0), unique=True)
-        self._software_farm_srv = rospy.ServiceProxy(software_farm_srv_name, concert_srvs.AllocateSoftware)
+        self._node_name = rospy.get_name()
+        self._software_farm_srv_name = rocon_python_comms.find_service('concert_msgs/AllocateSoftware', timeout=rospy.rostime.Duration(5.0), unique=True)
+        self._software_farm_srv = self._connect()
+        self._lock = threading.Lock()
+        rospy.on_shutdown(self.close)
+
+    def _connect(self):
+        return rospy.ServiceProxy(self._software_farm_srv_name, concert_srvs.AllocateSoftware, persistent=True)
+
+    def close(self):
+        '''
+        Close the persistent connection to the software farmer. Registered to run on shutdown.
+        '''
+        with self._lock:
+            self._software_farm_srv.close()
 
     def allocate(self, software_name):
         return self._request_farmer(software_name, True)
@@ -22,9 +44,21 @@ class SoftwareFarmClient(object):
 
     def _request_farmer(self, software_name, enable):
         req = concert_srvs.AllocateSoftwareRequest()
-        req.user = rospy.get_name()
+        req.user = self._node_name
         req.software = software_name 
         req.allocate = enable 
-        resp = self._software_farm_srv(req)
- 
+        with self._lock:
+            try:
+                resp = self._software_farm_srv(req)
+            except (rospy.exceptions.TransportException, rospy.ServiceException) as e:
+                # a stale connection (e.g. farmer restarted) fails on the write (TransportException)
+                # or on reading the reply, which rospy reports as a 'transport error' ServiceException.
+                # Either way build a fresh proxy and retry once. Handler side failures (any other
+                # ServiceException) are not retried, the farmer may have already acted on them.
+                if isinstance(e, rospy.ServiceException) and not str(e).startswith('transport error'):
+                    raise
+                self._software_farm_srv.close()
+                self._software_farm_srv = self._connect()
+                resp = self._software_farm_srv(req)
+
         return resp.success, resp.namespace
@@ -56,8 +56,8 @@ class SoftwareFarmer(object):
     def _allocate_software(self, software_name, user):
         resp = concert_srvs.AllocateSoftwareResponse()
         self.loginfo("User[%s] requested to use %s"%(user, software_name))
-        if software_name in self._running_software.keys():
-            instance = self._running_software[software_name]
+        instance = self._running_software.get(software_name)
+        if instance is not None:
             if instance.is_max_capacity(): 
                 resp.success = False
                 resp.error_message = "It exceeds software capacity" 
@@ -92,8 +92,8 @@ class SoftwareFarmer(object):
         self.loginfo("User[%s] requested to cancel %s"%(user, software_name))
         success = False
         message = ""
-        if software_name in self._running_software.keys():
-            instance = self._running_software[software_name]           
+        instance = self._running_software.get(software_name)
+        if instance is not None:
             success, num_user = instance.remove_user(user)
             if success: 
                 if num_user == 0:
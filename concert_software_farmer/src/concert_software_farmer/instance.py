@@ -16,7 +16,14 @@ import rocon_python_utils.ros
 import concert_msgs.msg as concert_msgs
 
 class SoftwareInstance(object):
-        
+
+    __slots__ = [
+        '_profile',    # concert_software_farmer.SoftwareProfile
+        '_namespace',  # namespace the software is launched in
+        '_users',      # names of the users currently sharing this instance
+        '_roslaunch',  # roslaunch parent of the running software
+    ]
+
     shutdown_timeout = 5
     kill_timeout = 10
     
@@ -24,6 +31,7 @@ class SoftwareInstance(object):
         self._profile = profile
         self._namespace = concert_msgs.Strings.SOFTWARE_NAMESPACE  + '/' + str(self._profile.name)
         self._users = []
+        self._roslaunch = None
 
     def to_msg(self):
         msg = concert_msgs.SoftwareInstance()
@@ -7,8 +7,11 @@
 
 import yaml
 import os
+import hashlib
+import pickle
 
 import rospkg
+import rospy
 import genpy
 import rocon_python_utils
 import rocon_std_msgs.msg as rocon_std_msgs
@@ -16,6 +19,37 @@ import concert_msgs.msg as concert_msgs
 
 from .exceptions import InvalidSoftwareprofileException
 
+##############################################################################
+# Methods
+##############################################################################
+
+
+def _software_index_cache_file():
+    return os.path.join(rocon_python_utils.ros.get_rocon_home(), 'software_index.pkl')
+
+
+def _package_path_fingerprint():
+    '''
+    Fingerprints the package.xml files on the ros package path. Adding, removing or
+    touching a package changes the fingerprint, so it can be used to validate a cached
+    software index without parsing every package.xml again.
+
+    :returns: hex digest of the package paths and their package.xml modification times
+    :rtype: str
+    '''
+    package_paths = [p for p in os.environ.get('ROS_PACKAGE_PATH', '').split(os.pathsep) if p]
+    package_xmls = []
+    for package_path in package_paths:
+        for root, dirs, files in os.walk(package_path, followlinks=True):
+            if 'package.xml' in files:
+                filename = os.path.join(root, 'package.xml')
+                package_xmls.append((filename, os.path.getmtime(filename)))
+                del dirs[:]  # packages do not nest
+            else:
+                dirs[:] = [d for d in dirs if not d.startswith('.')]
+    return hashlib.sha1(repr((package_paths, sorted(package_xmls))).encode('utf-8')).hexdigest()
+
+
 ##############################################################################
 # Classes
 ##############################################################################
@@ -24,6 +58,13 @@ class SoftwareProfile(object):
     '''
     parses software profile from file path. 
     '''
+    __slots__ = [
+        'resource_name',  # ros resource name of the software profile ('package/name')
+        '_filepath',      # full path to the software profile file
+        'msg',            # the loaded profile as a concert_msgs.SoftwareProfile
+        'name',           # unique name of the software, lowercase with spaces replaced by underscores
+    ]
+
     def __init__(self, resource_name, filepath):
         self.resource_name = resource_name
         self._filepath = filepath
@@ -82,13 +123,29 @@ class SoftwarePool(object):
 
     def _scan_registered_software(self): 
         '''
-        parses package exports to scan all available software in the system. and returns name and location
+        parses package exports to scan all available software in the system. and returns name and location.
+        The result is cached on disk and only rebuilt when a package on the ros package path changes.
         '''
+        cache_file = _software_index_cache_file()
+        fingerprint = _package_path_fingerprint()
+        try:
+            with open(cache_file, 'rb') as f:
+                cached_index = pickle.load(f)
+            if cached_index['fingerprint'] == fingerprint:
+                return cached_index['locations']
+        except Exception:
+            pass  # missing or broken cache (of any kind), never fatal - rebuild it
+
         cached_software_profile_information, unused_invalid_software = rocon_python_utils.ros.resource_index_from_package_exports(rocon_std_msgs.Strings.TAG_SOFTWARE)
         cached_software_profile_locations = {}
-        for cached_resource_name, (cached_filename, unused_catkin_package) in cached_software_profile_information.iteritems():
+        for cached_resource_name, (cached_filename, unused_catkin_package) in cached_software_profile_information.items():
             cached_software_profile_locations[cached_resource_name] = cached_filename
 
+        try:
+            with open(cache_file, 'wb') as f:
+                pickle.dump({'fingerprint': fingerprint, 'locations': cached_software_profile_locations}, f, pickle.HIGHEST_PROTOCOL)
+        except IOError as e:
+            rospy.logwarn("Software Farm : could not write the software index cache [%s]" % str(e))
         return cached_software_profile_locations
 
     def _load_software_profiles(self, software_locations):
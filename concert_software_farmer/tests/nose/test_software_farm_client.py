@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+#
+# License: BSD
+#   https://raw.github.com/robotics-in-concert/rocon_concert/license/LICENSE
+#
+
+##############################################################################
+# Imports
+##############################################################################
+
+# enable some python3 compatibility options:
+# (unicode_literals not compatible with python2 uuid module)
+from __future__ import absolute_import, print_function
+
+import threading
+
+from nose.tools import assert_raises
+
+import rospy
+
+import concert_software_farmer.client as client
+
+##############################################################################
+# Helpers
+##############################################################################
+
+
+class FakeResponse(object):
+
+    def __init__(self):
+        self.success = True
+        self.namespace = '/chatter'
+
+
+class FakeServiceProxy(object):
+    '''
+      Stands in for rospy's persistent service proxy. Each instance pops its
+      outcome for a call from the shared failures list (an exception to raise,
+      or None to succeed).
+    '''
+    instances = []
+    failures = []
+
+    def __init__(self, name, service_class, persistent=False):
+        self.calls = 0
+        self.closed = False
+        FakeServiceProxy.instances.append(self)
+
+    def __call__(self, req):
+        self.calls += 1
+        failure = FakeServiceProxy.failures.pop(0) if FakeServiceProxy.failures else None
+        if failure is not None:
+            raise failure
+        return FakeResponse()
+
+    def close(self):
+        self.closed = True
+
+
+def create_client():
+    farm_client = client.SoftwareFarmClient.__new__(client.SoftwareFarmClient)
+    farm_client._node_name = '/chatter_service'
+    farm_client._software_farm_srv_name = '/software_farmer/allocate'
+    farm_client._lock = threading.Lock()
+    farm_client._software_farm_srv = farm_client._connect()
+    return farm_client
+
+##############################################################################
+# Tests
+##############################################################################
+
+
+def test_reconnect():
+    print("\n****************************************************************************************")
+    print("* Software Farm Client Reconnects")
+    print("****************************************************************************************")
+    print("")
+    original_service_proxy = client.rospy.ServiceProxy
+    client.rospy.ServiceProxy = FakeServiceProxy
+    try:
+        for failure in [rospy.exceptions.TransportTerminated('connection reset'),
+                        rospy.ServiceException('transport error completing service call: receive_once[/software_farmer/allocate]: DeserializationError')]:
+            FakeServiceProxy.instances = []
+            FakeServiceProxy.failures = [failure]
+            farm_client = create_client()
+            assert farm_client.allocate('concert_software_farmer/chatter') == (True, '/chatter')
+            stale_proxy, fresh_proxy = FakeServiceProxy.instances
+            assert stale_proxy.closed and stale_proxy.calls == 1
+            assert farm_client._software_farm_srv is fresh_proxy and fresh_proxy.calls == 1
+    finally:
+        client.rospy.ServiceProxy = original_service_proxy
+
+
+def test_no_retry_on_handler_failure():
+    print("\n****************************************************************************************")
+    print("* Software Farm Client Does Not Retry Handler Failures")
+    print("****************************************************************************************")
+    print("")
+    original_service_proxy = client.rospy.ServiceProxy
+    client.rospy.ServiceProxy = FakeServiceProxy
+    try:
+        FakeServiceProxy.instances = []
+        FakeServiceProxy.failures = [rospy.ServiceException('service [/software_farmer/allocate] responded with an error: ')]
+        farm_client = create_client()
+        assert_raises(rospy.ServiceException, farm_client.allocate, 'concert_software_farmer/chatter')
+        assert len(FakeServiceProxy.instances) == 1
+        assert FakeServiceProxy.instances[0].calls == 1
+        assert not FakeServiceProxy.instances[0].closed
+    finally:
+        client.rospy.ServiceProxy = original_service_proxy
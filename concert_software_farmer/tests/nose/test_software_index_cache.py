@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+#
+# License: BSD
+#   https://raw.github.com/robotics-in-concert/rocon_concert/license/LICENSE
+#
+
+##############################################################################
+# Imports
+##############################################################################
+
+# enable some python3 compatibility options:
+# (unicode_literals not compatible with python2 uuid module)
+from __future__ import absolute_import, print_function
+
+import os
+import shutil
+import tempfile
+
+import concert_software_farmer.pool as pool
+
+##############################################################################
+# Tests
+##############################################################################
+
+def test_software_index_cache():
+    print("\n****************************************************************************************")
+    print("* Software Index Cache")
+    print("****************************************************************************************")
+    print("")
+    workspace = tempfile.mkdtemp()
+    package_xml = os.path.join(workspace, 'chatter_software', 'package.xml')
+    os.makedirs(os.path.dirname(package_xml))
+    with open(package_xml, 'w') as f:
+        f.write("<package><name>chatter_software</name></package>\n")
+    cache_file = os.path.join(workspace, 'software_index.pkl')
+    scans = []
+
+    def resource_index_from_package_exports(tag):
+        scans.append(tag)
+        return {'chatter_software/chatter': ('/opt/chatter.software', None)}, {}
+
+    original_cache_file = pool._software_index_cache_file
+    original_resource_index = pool.rocon_python_utils.ros.resource_index_from_package_exports
+    original_package_path = os.environ.get('ROS_PACKAGE_PATH')
+    pool._software_index_cache_file = lambda: cache_file
+    pool.rocon_python_utils.ros.resource_index_from_package_exports = resource_index_from_package_exports
+    os.environ['ROS_PACKAGE_PATH'] = workspace
+    try:
+        software_pool = pool.SoftwarePool.__new__(pool.SoftwarePool)
+        expected = {'chatter_software/chatter': '/opt/chatter.software'}
+        # first scan fills the cache
+        assert software_pool._scan_registered_software() == expected
+        assert len(scans) == 1
+        # unchanged package path is served from the cache
+        assert software_pool._scan_registered_software() == expected
+        assert len(scans) == 1
+        # touching a package.xml invalidates it
+        os.utime(package_xml, (0, 0))
+        assert software_pool._scan_registered_software() == expected
+        assert len(scans) == 2
+        # a corrupt cache is rebuilt, not fatal
+        with open(cache_file, 'wb') as f:
+            f.write(b'\x80\x02garbage')
+        assert software_pool._scan_registered_software() == expected
+        assert len(scans) == 3
+        assert software_pool._scan_registered_software() == expected
+        assert len(scans) == 3
+    finally:
+        pool._software_index_cache_file = original_cache_file
+        pool.rocon_python_utils.ros.resource_index_from_package_exports = original_resource_index
+        if original_package_path is None:
+            del os.environ['ROS_PACKAGE_PATH']
+        else:
+            os.environ['ROS_PACKAGE_PATH'] = original_package_path
+        shutil.rmtree(workspace)
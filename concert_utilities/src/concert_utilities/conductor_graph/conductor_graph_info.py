@@ -74,14 +74,14 @@ class ConductorGraphInfo(object):
         #print("[conductor_graph_info] : update clients callback")
         self._graph = msg
         # sneaky way of getting all the states and the lists
-        visible_concert_clients_by_name = []
+        visible_concert_clients_by_name = set()
         for state in msg.__slots__:
             if state == concert_msgs.ConcertClientState.GONE:
                 continue
             concert_clients = getattr(msg, state)  # by state
             for concert_client in concert_clients:  # concert_msgs.ConcertClient
-                visible_concert_clients_by_name.append(concert_client.name)
-                if concert_client.name in self.concert_clients.keys():
+                visible_concert_clients_by_name.add(concert_client.name)
+                if concert_client.name in self.concert_clients:
                     self.concert_clients[concert_client.name].is_new = False
                     self.concert_clients[concert_client.name].update(concert_client)
                 else:
@@ -104,7 +104,7 @@ class ConductorGraphInfo(object):
         for state in msg.__slots__:
             concert_clients = getattr(msg, state)  # by state
             for concert_client in concert_clients:  # concert_msgs.ConcertClient
-                if concert_client.name in self.concert_clients.keys():
+                if concert_client.name in self.concert_clients:
                     # pick up the changing information in the msg and pass it to our class
                     self.concert_clients[concert_client.name].update(concert_client)
                 else:
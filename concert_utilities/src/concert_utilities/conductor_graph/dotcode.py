@@ -132,7 +132,7 @@ class ConductorGraphDotcodeGenerator:
         if nodes is not None:
             for node in nodes:
                 if clusters:
-                    if node.ip not in ip_clusters.keys():
+                    if node.ip not in ip_clusters:
                         ip_clusters[node.ip] = dotcode_factory.add_subgraph_to_graph(dotgraph, node.ip, rank=rank, rankdir=orientation, simplify=simplify)
                     self._add_node(node, dotcode_factory=dotcode_factory, dotgraph=ip_clusters[node.ip])
                 else: